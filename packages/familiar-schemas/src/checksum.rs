@@ -1,9 +1,36 @@
 //! Checksum utilities for schema integrity verification
 
 use sha2::{Sha256, Digest};
+use sha2::digest::Output;
 use serde::{Deserialize, Serialize};
 use std::fmt;
 
+/// Lowercase hex digits, indexed by nibble
+const HEX_DIGITS: &[u8; 16] = b"0123456789abcdef";
+
+/// Encode a digest as lowercase hex via nibble lookup
+fn to_hex(digest: &[u8]) -> String {
+    let mut out = Vec::with_capacity(digest.len() * 2);
+    for &byte in digest {
+        out.push(HEX_DIGITS[(byte >> 4) as usize]);
+        out.push(HEX_DIGITS[(byte & 0x0f) as usize]);
+    }
+    // Every byte pushed comes from HEX_DIGITS, so this is always valid ASCII
+    String::from_utf8(out).expect("hex digits are ASCII")
+}
+
+/// Hash the compact serialization of a JSON value
+fn json_digest(value: &serde_json::Value) -> Output<Sha256> {
+    // Stream the serialization straight into the hasher rather than building
+    // the canonical string first; the bytes hashed are the same as
+    // `serde_json::to_string`.
+    let mut hasher = Sha256::new();
+    if serde_json::to_writer(&mut hasher, value).is_err() {
+        return Sha256::digest(b"");
+    }
+    hasher.finalize()
+}
+
 /// SHA256 checksum for schema content
 #[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
 pub struct Checksum(String);
@@ -11,8 +38,7 @@ pub struct Checksum(String);
 impl Checksum {
     /// Compute checksum from raw bytes
     pub fn from_bytes(data: &[u8]) -> Self {
-        let hash = Sha256::digest(data);
-        Self(format!("{:x}", hash))
+        Self(to_hex(&Sha256::digest(data)))
     }
 
     /// Compute checksum from a string
@@ -22,9 +48,7 @@ impl Checksum {
 
     /// Compute checksum from JSON value (canonicalized)
     pub fn from_json(value: &serde_json::Value) -> Self {
-        // Canonicalize JSON by converting to string with sorted keys
-        let canonical = serde_json::to_string(value).unwrap_or_default();
-        Self::from_str(&canonical)
+        Self(to_hex(&json_digest(value)))
     }
 
     /// Get the hex string representation
@@ -34,14 +58,22 @@ impl Checksum {
 
     /// Verify that content matches this checksum
     pub fn verify(&self, content: &str) -> bool {
-        let computed = Self::from_str(content);
-        self.0 == computed.0
+        self.matches_digest(&Sha256::digest(content.as_bytes()))
     }
 
     /// Verify that JSON value matches this checksum
     pub fn verify_json(&self, value: &serde_json::Value) -> bool {
-        let computed = Self::from_json(value);
-        self.0 == computed.0
+        self.matches_digest(&json_digest(value))
+    }
+
+    /// Compare a raw digest against the stored hex without re-encoding it
+    fn matches_digest(&self, digest: &[u8]) -> bool {
+        let hex = self.0.as_bytes();
+        hex.len() == digest.len() * 2
+            && digest.iter().zip(hex.chunks_exact(2)).all(|(&byte, pair)| {
+                pair[0] == HEX_DIGITS[(byte >> 4) as usize]
+                    && pair[1] == HEX_DIGITS[(byte & 0x0f) as usize]
+            })
     }
 }
 
@@ -90,6 +122,25 @@ mod tests {
         let checksum = Checksum::from_str(content);
         assert!(checksum.verify(content));
         assert!(!checksum.verify("different content"));
+        assert!(!Checksum::from(checksum.as_str().to_uppercase()).verify(content));
+        assert!(!Checksum::from("abc").verify(content));
+    }
+
+    #[test]
+    fn test_checksum_known_vector() {
+        let checksum = Checksum::from_str("abc");
+        assert_eq!(
+            checksum.as_str(),
+            "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        );
+    }
+
+    #[test]
+    fn test_checksum_from_json_matches_serialized() {
+        let value = serde_json::json!({"name": "test", "tags": ["a", "b"], "nested": {"n": 1}});
+        let expected = Checksum::from_str(&serde_json::to_string(&value).unwrap());
+        assert_eq!(Checksum::from_json(&value), expected);
+        assert!(expected.verify_json(&value));
     }
 }
 
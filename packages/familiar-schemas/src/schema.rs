@@ -214,43 +214,46 @@ pub struct ManifestStats {
 impl VersionManifest {
     /// Create a new manifest from schemas
     pub fn new(version: SchemaVersion, schemas: Vec<SchemaEntry>) -> Self {
-        // Count by type
-        let json_schemas = schemas.iter().filter(|s| s.schema.schema_type == SchemaType::JsonSchema).count();
-        let protobuf_schemas = schemas.iter().filter(|s| s.schema.schema_type == SchemaType::Protobuf).count();
-        let avro_schemas = schemas.iter().filter(|s| s.schema.schema_type == SchemaType::Avro).count();
-        let database_schemas = schemas.iter().filter(|s| s.schema.schema_type == SchemaType::Database).count();
-        let typescript_schemas = schemas.iter().filter(|s| s.schema.schema_type == SchemaType::TypeScript).count();
-        let python_schemas = schemas.iter().filter(|s| s.schema.schema_type == SchemaType::Python).count();
-
-        // Count by category
-        let mut by_category: std::collections::HashMap<String, usize> = std::collections::HashMap::new();
-        for s in &schemas {
-            *by_category.entry(s.schema.category.clone()).or_insert(0) += 1;
-        }
+        let mut stats = ManifestStats {
+            total_schemas: schemas.len(),
+            json_schemas: 0,
+            protobuf_schemas: 0,
+            avro_schemas: 0,
+            database_schemas: 0,
+            typescript_schemas: 0,
+            python_schemas: 0,
+            by_category: std::collections::HashMap::new(),
+            by_source_crate: std::collections::HashMap::new(),
+        };
 
-        // Count by source crate
-        let mut by_source_crate: std::collections::HashMap<String, usize> = std::collections::HashMap::new();
+        // Count by type, category and source crate in a single pass
         for s in &schemas {
+            match s.schema.schema_type {
+                SchemaType::JsonSchema => stats.json_schemas += 1,
+                SchemaType::Protobuf => stats.protobuf_schemas += 1,
+                SchemaType::Avro => stats.avro_schemas += 1,
+                SchemaType::Database => stats.database_schemas += 1,
+                SchemaType::TypeScript => stats.typescript_schemas += 1,
+                SchemaType::Python => stats.python_schemas += 1,
+                SchemaType::OpenApi => {}
+            }
+
+            count_key(&mut stats.by_category, &s.schema.category);
+
             if let Some(ref crate_name) = s.schema.source_crate {
-                *by_source_crate.entry(crate_name.clone()).or_insert(0) += 1;
+                count_key(&mut stats.by_source_crate, crate_name);
             }
         }
 
-        let stats = ManifestStats {
-            total_schemas: schemas.len(),
-            json_schemas,
-            protobuf_schemas,
-            avro_schemas,
-            database_schemas,
-            typescript_schemas,
-            python_schemas,
-            by_category,
-            by_source_crate,
-        };
-
         // Compute manifest checksum from all schema checksums
-        let checksums: Vec<String> = schemas.iter().map(|s| s.checksum.to_string()).collect();
-        let combined = checksums.join(",");
+        let capacity = schemas.iter().map(|s| s.checksum.as_str().len() + 1).sum();
+        let mut combined = String::with_capacity(capacity);
+        for (i, s) in schemas.iter().enumerate() {
+            if i > 0 {
+                combined.push(',');
+            }
+            combined.push_str(s.checksum.as_str());
+        }
         let manifest_checksum = Checksum::from_str(&combined);
 
         Self {
@@ -282,3 +285,64 @@ impl VersionManifest {
         self.schemas.iter().filter(|s| s.schema.category == category).collect()
     }
 }
+
+/// Increment the count for `key`, allocating an owned key only on first sight
+fn count_key(counts: &mut std::collections::HashMap<String, usize>, key: &str) {
+    match counts.get_mut(key) {
+        Some(count) => *count += 1,
+        None => {
+            counts.insert(key.to_string(), 1);
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn entry(name: &str, schema_type: SchemaType, category: &str, source_crate: Option<&str>) -> SchemaEntry {
+        let mut schema = Schema::with_category(name, schema_type, serde_json::json!({"title": name}), category);
+        if let Some(crate_name) = source_crate {
+            schema.set_source_crate(crate_name);
+        }
+        SchemaEntry::new(schema, SchemaVersion::parse("1.0.0").unwrap())
+    }
+
+    #[test]
+    fn test_manifest_stats() {
+        let manifest = VersionManifest::new(
+            SchemaVersion::parse("1.0.0").unwrap(),
+            vec![
+                entry("User", SchemaType::JsonSchema, "auth", Some("familiar-core")),
+                entry("UserId", SchemaType::JsonSchema, "primitives", Some("familiar-primitives")),
+                entry("EventEnvelope", SchemaType::Avro, "kafka", None),
+                entry("Session", SchemaType::JsonSchema, "auth", Some("familiar-core")),
+                entry("Api", SchemaType::OpenApi, "api", None),
+            ],
+        );
+
+        assert_eq!(manifest.stats.total_schemas, 5);
+        assert_eq!(manifest.stats.json_schemas, 3);
+        assert_eq!(manifest.stats.avro_schemas, 1);
+        assert_eq!(manifest.stats.protobuf_schemas, 0);
+        assert_eq!(manifest.stats.by_category.get("auth"), Some(&2));
+        assert_eq!(manifest.stats.by_category.get("kafka"), Some(&1));
+        assert_eq!(manifest.stats.by_source_crate.get("familiar-core"), Some(&2));
+        assert_eq!(manifest.stats.by_source_crate.len(), 2);
+        assert!(manifest.verify_all());
+    }
+
+    #[test]
+    fn test_manifest_checksum_joins_entry_checksums() {
+        let entries = vec![
+            entry("User", SchemaType::JsonSchema, "auth", None),
+            entry("UserId", SchemaType::JsonSchema, "primitives", None),
+        ];
+        let expected = Checksum::from_str(&format!("{},{}", entries[0].checksum, entries[1].checksum));
+        let manifest = VersionManifest::new(SchemaVersion::parse("1.0.0").unwrap(), entries);
+        assert_eq!(manifest.manifest_checksum, expected);
+
+        let empty = VersionManifest::new(SchemaVersion::parse("1.0.0").unwrap(), Vec::new());
+        assert_eq!(empty.manifest_checksum, Checksum::from_str(""));
+    }
+}